@@ -27,6 +27,7 @@ from bs4 import BeautifulSoup
 import re
 import subprocess
 import tempfile
+import functools
 
 
 # Try to import packaging for robust version comparison
@@ -124,9 +125,9 @@ import serial.tools.list_ports
 # ARDUINO CLI SETUP AND AUTO-INSTALLATION
 # ============================================================================
 arduino_cli_version = "1.2.2"
-def get_latest_arduino_cli_version():
-    """Get the latest Arduino CLI version from GitHub releases API"""
-    global arduino_cli_version
+@functools.lru_cache(maxsize=1)
+def fetch_latest_arduino_cli_release():
+    """Query the GitHub releases API once per session, None if unavailable"""
     try:
         response = requests.get(
             "https://api.github.com/repos/arduino/arduino-cli/releases/latest",
@@ -134,13 +135,19 @@ def get_latest_arduino_cli_version():
         )
         if response.status_code == 200:
             release_data = response.json()
-            version = release_data.get('tag_name', '').lstrip('v')  # Remove 'v' prefix if present
-            if version:
-                arduino_cli_version = version
-                return version
+            return release_data.get('tag_name', '').lstrip('v') or None  # Remove 'v' prefix if present
     except Exception:
         # Don't print here since safe_print might not be defined yet
         pass
+    return None
+
+def get_latest_arduino_cli_version():
+    """Get the latest Arduino CLI version from GitHub releases API"""
+    global arduino_cli_version
+    version = fetch_latest_arduino_cli_release()
+    if version:
+        arduino_cli_version = version
+        return version
     
     # Fallback to known working version
     return "1.2.2"
@@ -190,15 +197,8 @@ def download_and_extract_arduino_cli():
         version = get_latest_arduino_cli_version()
         safe_print(f"Using Arduino CLI version: {version}", Fore.CYAN)
         
-        # Check if we're using fallback version
-        try:
-            response = requests.get(
-                "https://api.github.com/repos/arduino/arduino-cli/releases/latest",
-                timeout=5
-            )
-            if response.status_code != 200:
-                safe_print("Using fallback version (GitHub API unavailable)", Fore.YELLOW)
-        except Exception:
+        # Check if we're using fallback version (cached, no extra request)
+        if fetch_latest_arduino_cli_release() is None:
             safe_print("Using fallback version (GitHub API unavailable)", Fore.YELLOW)
         
         safe_print("Downloading Arduino CLI...", Fore.CYAN)
@@ -228,7 +228,7 @@ def download_and_extract_arduino_cli():
                             with zip_ref.open(file_info) as source:
                                 exe_name = "arduino-cli.exe" if sys.platform == "win32" else "arduino-cli"
                                 with open(exe_name, 'wb') as target:
-                                    target.write(source.read())
+                                    copy_stream(source, target, file_info.file_size)
                                 # Make executable on Unix-like systems
                                 if sys.platform != "win32":
                                     os.chmod(exe_name, 0o755)
@@ -281,6 +281,9 @@ def setup_arduino_cli():
     
     arduino = None
     for cli_path in cli_paths:
+        # Filesystem lookup first, so missing candidates don't cost a spawn
+        if not shutil.which(cli_path):
+            continue
         try:
             arduino = pyduinocli.Arduino(cli_path)
             # Test if Arduino CLI is working
@@ -428,6 +431,9 @@ app_update_repo = "Architeuthis-Flux/JumperlessV5"  # Repository for app updates
 app_script_name = "JumperlessWokwiBridge.py"
 app_requirements_name = "requirements.txt"
 
+# Matches the App_Version line near the top of an app script, quoted or bare
+app_version_pattern = re.compile(r"""^\s*App_Version\s*=\s*(?:"([^"]*)"|'([^']*)'|([^#]*))""")
+
 # Debug/Testing settings for app updates
 debug_app_update = False # Set to True to use local file for testing
 debug_test_file = "jumperlesswokwibridgecopyfortesting.py"  # Local test file
@@ -444,6 +450,23 @@ def resource_path(relative_path):
     base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
     return os.path.join(base_path, relative_path)
 
+def copy_stream(source, target, size=None, buffer_size=1 << 20):
+    """Copy between file objects through one reused buffer with readinto()
+
+    Large files (like the arduino-cli binary) are never held in memory whole.
+    Files known to be small skip the buffer allocation.
+    """
+    if size is not None and size < 128 * 1024:
+        target.write(source.read())
+        return
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        count = source.readinto(buffer)
+        if not count:
+            break
+        target.write(view[:count])
+
 def safe_print(message, color=None, end='\n'):
     """Cross-platform safe printing with optional color"""
     if color and COLORS_AVAILABLE:
@@ -1381,7 +1404,7 @@ def update_jumperless_firmware(force=False):
                                         try:
                                             drive_letter = mountpoint.rstrip('\\').rstrip('/')
                                             result = subprocess.run(['vol', drive_letter], 
-                                                                  capture_output=True, text=True, timeout=2)
+                                                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=2)
                                             if result.returncode == 0:
                                                 output = result.stdout.strip()
                                                 safe_print(f"Volume info for {drive_letter}: {output}", Fore.YELLOW)
@@ -1505,6 +1528,17 @@ def compare_versions(version1, version2):
         # Last resort: string comparison
         return version1 != version2
 
+def parse_app_version(lines, max_lines=20):
+    """Return the App_Version value from the first lines of a script, or None"""
+    for line_number, line in enumerate(lines):
+        if line_number >= max_lines:
+            break
+        match = app_version_pattern.match(line)
+        if match:
+            app_version = next(group for group in match.groups() if group is not None).strip().strip("\"'")
+            return app_version or None
+    return None
+
 def get_latest_app_version():
     """Get the latest app version by downloading and reading the script file"""
     try:
@@ -1517,41 +1551,9 @@ def get_latest_app_version():
                 return None, None
             
             try:
+                # Stream the file, only the first few lines are ever needed
                 with open(debug_test_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                
-                app_version = None
-                for line in lines[:20]:  # Check first 20 lines
-                    line = line.strip()
-                    if line.startswith('App_Version') and '=' in line:
-                        try:
-                            # Extract version from line like: App_Version = "1.1.1.1"
-                            version_part = line.split('=', 1)[1].strip()
-                            
-                            # Find the quoted string
-                            if '"' in version_part:
-                                # Extract content between first pair of double quotes
-                                start_quote = version_part.find('"')
-                                end_quote = version_part.find('"', start_quote + 1)
-                                if end_quote > start_quote:
-                                    app_version = version_part[start_quote + 1:end_quote]
-                                else:
-                                    app_version = version_part.strip('"\'').strip()
-                            elif "'" in version_part:
-                                # Extract content between first pair of single quotes
-                                start_quote = version_part.find("'")
-                                end_quote = version_part.find("'", start_quote + 1)
-                                if end_quote > start_quote:
-                                    app_version = version_part[start_quote + 1:end_quote]
-                                else:
-                                    app_version = version_part.strip('"\'').strip()
-                            else:
-                                # No quotes, take everything until comment or end of line
-                                app_version = version_part.split('#')[0].strip()
-                            break
-                        except Exception as e:
-                            safe_print(f"Error parsing version line '{line}': {e}", Fore.YELLOW)
-                            continue
+                    app_version = parse_app_version(f)
                 
                 if app_version:
                     safe_print(f"Found app version in test file: {app_version}", Fore.GREEN)
@@ -1593,42 +1595,7 @@ def get_latest_app_version():
             return None, None
         
         # Read the first few lines to find App_Version
-        script_content = script_response.text
-        lines = script_content.split('\n')
-        
-        app_version = None
-        for line in lines[:20]:  # Check first 20 lines
-            line = line.strip()
-            if line.startswith('App_Version') and '=' in line:
-                try:
-                    # Extract version from line like: App_Version = "1.1.1.1"
-                    version_part = line.split('=', 1)[1].strip()
-                    
-                    # Find the quoted string
-                    if '"' in version_part:
-                        # Extract content between first pair of double quotes
-                        start_quote = version_part.find('"')
-                        end_quote = version_part.find('"', start_quote + 1)
-                        if end_quote > start_quote:
-                            app_version = version_part[start_quote + 1:end_quote]
-                        else:
-                            app_version = version_part.strip('"\'').strip()
-                    elif "'" in version_part:
-                        # Extract content between first pair of single quotes
-                        start_quote = version_part.find("'")
-                        end_quote = version_part.find("'", start_quote + 1)
-                        if end_quote > start_quote:
-                            app_version = version_part[start_quote + 1:end_quote]
-                        else:
-                            app_version = version_part.strip('"\'').strip()
-                    else:
-                        # No quotes, take everything until comment or end of line
-                        app_version = version_part.split('#')[0].strip()
-                    break
-                except Exception as e:
-                    if debugWokwi:
-                        safe_print(f"Error parsing version line '{line}': {e}", Fore.YELLOW)
-                    continue
+        app_version = parse_app_version(script_response.text.split('\n', 20))
         
         if app_version:
             safe_print(f"Found app version in script: {app_version}", Fore.GREEN)
@@ -1685,7 +1652,7 @@ def download_app_update():
                 
                 # Copy the test file to temp location
                 with open(debug_test_file, 'rb') as source_file:
-                    temp_file.write(source_file.read())
+                    copy_stream(source_file, temp_file, os.fstat(source_file.fileno()).st_size)
             
             safe_print("Test file copied successfully", Fore.GREEN)
             
@@ -1817,15 +1784,46 @@ def cleanup_old_backups():
     except Exception as e:
         safe_print(f"Error during backup cleanup: {e}", Fore.YELLOW)
 
+def requirements_satisfied(requirements_path):
+    """Check installed package versions against requirements.txt without running pip"""
+    if not PACKAGING_AVAILABLE:
+        return False
+    try:
+        import importlib.metadata
+        from packaging.requirements import Requirement
+        
+        with open(requirements_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                requirement = Requirement(line)
+                if requirement.marker is not None and not requirement.marker.evaluate():
+                    continue
+                installed = importlib.metadata.version(requirement.name)
+                if not requirement.specifier.contains(installed, prereleases=True):
+                    return False
+        return True
+    except Exception:
+        # Missing package, or a line only pip understands (-r, URLs, ...)
+        return False
+
 def install_requirements(requirements_path):
     """Install requirements from downloaded requirements.txt"""
     try:
+        # Nothing to do, skip starting a second interpreter for pip
+        if requirements_satisfied(requirements_path):
+            safe_print("Requirements already satisfied", Fore.GREEN)
+            return True
+        
         safe_print("Installing new requirements...", Fore.CYAN)
         
         # Run pip install
-        cmd = [sys.executable, '-m', 'pip', 'install', '-r', requirements_path]
+        cmd = [sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check',
+               '--no-input', '-r', requirements_path]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        # Only stderr is reported, so stdout is discarded instead of buffered
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=300)
         
         if result.returncode == 0:
             safe_print("Requirements installed successfully", Fore.GREEN)
@@ -2481,6 +2479,37 @@ def handle_flash_command():
     forceArduinoFlash = 0
     return False
 
+# arduino-cli paths already verified to know the Nano. Installed cores
+# don't change between uploads, so later uploads skip listing every board
+verified_cli_paths = set()
+
+def verify_nano_board_available(cli_path):
+    """Check that arduino-cli knows the arduino:avr:nano FQBN, once per session"""
+    if cli_path in verified_cli_paths:
+        return
+    try:
+        list_cmd = [cli_path, "board", "listall", "--format", "text"]
+        list_result = subprocess.run(list_cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=10)
+        if list_result.returncode == 0:
+            available_boards = list_result.stdout
+            if "arduino:avr:nano" not in available_boards:
+                safe_print("Warning: arduino:avr:nano not found in available boards", Fore.YELLOW)
+                # Look for alternative nano boards
+                nano_boards = [line for line in available_boards.split('\n') if 'nano' in line.lower()]
+                if nano_boards:
+                    safe_print("Available Nano boards:", Fore.CYAN)
+                    for board in nano_boards[:3]:
+                        safe_print(f"  {board}", Fore.CYAN)
+            else:
+                safe_print("Verified: arduino:avr:nano is available", Fore.GREEN)
+                # Only a successful check is remembered, failures and
+                # timeouts are retried on the next upload
+                verified_cli_paths.add(cli_path)
+        else:
+            safe_print(f"Could not verify FQBN (command failed: {list_result.stderr})", Fore.YELLOW)
+    except Exception as verify_error:
+        safe_print(f"Could not verify FQBN: {verify_error}", Fore.YELLOW)
+
 def upload_with_attempts_limit(sketch_dir, arduino_port, fqbn, build_dir, discovery_timeout="2s"):
     """Custom upload function that calls arduino-cli directly with attempts limit"""
     global ser, arduinoPort
@@ -2506,25 +2535,7 @@ def upload_with_attempts_limit(sketch_dir, arduino_port, fqbn, build_dir, discov
             raise Exception("arduino-cli not found")
         
         # Verify FQBN is valid by listing available boards
-        try:
-            list_cmd = [cli_path, "board", "listall", "--format", "text"]
-            list_result = subprocess.run(list_cmd, capture_output=True, text=True, timeout=10)
-            if list_result.returncode == 0:
-                available_boards = list_result.stdout
-                if "arduino:avr:nano" not in available_boards:
-                    safe_print("Warning: arduino:avr:nano not found in available boards", Fore.YELLOW)
-                    # Look for alternative nano boards
-                    nano_boards = [line for line in available_boards.split('\n') if 'nano' in line.lower()]
-                    if nano_boards:
-                        safe_print("Available Nano boards:", Fore.CYAN)
-                        for board in nano_boards[:3]:
-                            safe_print(f"  {board}", Fore.CYAN)
-                else:
-                    safe_print("Verified: arduino:avr:nano is available", Fore.GREEN)
-            else:
-                safe_print(f"Could not verify FQBN (command failed: {list_result.stderr})", Fore.YELLOW)
-        except Exception as verify_error:
-            safe_print(f"Could not verify FQBN: {verify_error}", Fore.YELLOW)
+        verify_nano_board_available(cli_path)
         
         # Force clear and verify Arduino port before upload
         arduino_serial = None
@@ -3280,14 +3291,14 @@ def check_port_usage(port_name):
         import sys
         
         if sys.platform == "darwin":  # macOS
-            result = subprocess.run(['lsof', port_name], capture_output=True, text=True, timeout=5)
+            result = subprocess.run(['lsof', port_name], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
                 safe_print(f"Processes using {port_name}:", Fore.YELLOW)
                 for line in result.stdout.strip().split('\n')[1:]:  # Skip header
                     safe_print(f"  {line}", Fore.YELLOW)
                 return True
         elif sys.platform.startswith("linux"):
-            result = subprocess.run(['lsof', port_name], capture_output=True, text=True, timeout=5)
+            result = subprocess.run(['lsof', port_name], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5)
             if result.returncode == 0 and result.stdout.strip():
                 safe_print(f"Processes using {port_name}:", Fore.YELLOW)
                 for line in result.stdout.strip().split('\n')[1:]:  # Skip header
@@ -3996,7 +4007,9 @@ def serial_term_in():
         if updateInProgress == 0:
             try:
                 if ser and ser.is_open and ser.in_waiting > 0:
-                    input_buffer = b''
+                    # bytearray appends in place, bytes += would copy the
+                    # whole buffer for every byte received
+                    input_buffer = bytearray()
                     
                     # Read byte-by-byte until buffer stabilizes
                     while serialconnected and ser and ser.is_open:
@@ -4017,7 +4030,7 @@ def serial_term_in():
                     if input_buffer:
                         try:
                             # Always check for interactive mode control characters
-                            filtered_buffer = b''
+                            filtered_buffer = bytearray()
                             
                             for byte in input_buffer:
                                 if byte == 0x0E:  # SO (Shift Out) - Enable interactive mode
@@ -4034,7 +4047,7 @@ def serial_term_in():
                                         safe_print("Interactive mode disabled by device",end="\n\r", color=Fore.GREEN)
                                 else:
                                     # Keep all other bytes for normal processing
-                                    filtered_buffer += bytes([byte])
+                                    filtered_buffer.append(byte)
                             
                             # Only print output if not in menu mode and there's actual content
                             if menuEntered == 0 and filtered_buffer:
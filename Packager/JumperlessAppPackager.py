@@ -7,13 +7,183 @@ Creates AppImages, executables, and portable packages for Linux, Windows, and ma
 import os
 import sys
 import shutil
+import stat
 import pathlib
+import re
 import subprocess
-import time
-import zipfile
-import tarfile
-import json
-from pathlib import Path
+import argparse
+import fnmatch
+import functools
+import gzip
+import zlib
+import collections
+import concurrent.futures
+
+# Buffer size for archive I/O. The 8-16 KiB defaults mean thousands of small
+# read()/write() syscalls per AppImage, which are tens of MB each.
+ARCHIVE_BUFSIZE = 1 << 20
+
+# Buffer for the archive output file itself, so the compressed stream reaches
+# the disk in a few large writes
+ARCHIVE_WRITE_BUFSIZE = 4 << 20
+
+# Default gzip level for the distribution tarball. Its bulk is
+# already-compressed AppImages, so levels above 1 cost several times the CPU
+# for <2% smaller output. Override with --compresslevel.
+ARCHIVE_COMPRESSLEVEL = 1
+
+# Blocks whose samples from both ends deflate to more than this fraction of
+# their size are already compressed (AppImage squashfs payloads, PNGs) and get
+# stored. Deciding per block keeps text that follows an AppImage compressed.
+INCOMPRESSIBLE_BLOCK_SIZE = 1 << 20
+INCOMPRESSIBLE_SAMPLE_SIZE = 64 << 10
+INCOMPRESSIBLE_RATIO = 0.97
+
+# Output locations, built once instead of re-parsed at every use
+APPIMAGE_DIR = pathlib.Path("builds/linux/appimage")
+DISTRIBUTION_ARCHIVE = APPIMAGE_DIR.parent / "Jumperless-Linux.tar.gz"
+
+class ParallelGzipWriter:
+    """Write-only file object that gzips fixed-size chunks on a thread pool.
+
+    Each chunk becomes its own gzip member. Concatenated members are a valid
+    .gz file that tar, gunzip and Python's gzip module all read in one pass.
+    zlib releases the GIL while compressing, so threads use every core.
+    """
+
+    def __init__(self, fileobj, compresslevel=9, chunk_size=4 << 20, workers=None):
+        self.fileobj = fileobj
+        self.compresslevel = compresslevel
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self._buffer = bytearray()
+        self._pending = collections.deque()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+
+    @staticmethod
+    def _is_incompressible(block):
+        for sample in (block[:INCOMPRESSIBLE_SAMPLE_SIZE], block[-INCOMPRESSIBLE_SAMPLE_SIZE:]):
+            if len(zlib.compress(sample, 1)) < len(sample) * INCOMPRESSIBLE_RATIO:
+                return False
+        return True
+
+    def _compress(self, chunk):
+        # Deflating already-compressed blocks would burn CPU for no size
+        # reduction, so they are stored. Runs of blocks at the same level
+        # share one gzip member.
+        view = memoryview(chunk)
+        members = []
+        run_start, run_level = 0, None
+        for start in range(0, len(view), INCOMPRESSIBLE_BLOCK_SIZE):
+            block = view[start:start + INCOMPRESSIBLE_BLOCK_SIZE]
+            level = 0 if self._is_incompressible(block) else self.compresslevel
+            if run_level is not None and level != run_level:
+                members.append(gzip.compress(view[run_start:start], run_level, mtime=0))
+                run_start = start
+            run_level = level
+        members.append(gzip.compress(view[run_start:], run_level, mtime=0))
+        return b"".join(members)
+
+    def _submit(self, chunk):
+        try:
+            self._pending.append(self._executor.submit(self._compress, chunk))
+        except RuntimeError:
+            # Pool could not start a worker thread, compress serially instead
+            self._pending.append(self._compress(chunk))
+        
+        # Keep a bounded number of chunks in flight, written in order
+        while len(self._pending) > 2 * self.workers:
+            self._write_next()
+
+    def _write_next(self):
+        result = self._pending.popleft()
+        if isinstance(result, concurrent.futures.Future):
+            result = result.result()
+        self.fileobj.write(result)
+
+    def write(self, data):
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            chunk = bytes(self._buffer[:self.chunk_size])
+            del self._buffer[:self.chunk_size]
+            self._submit(chunk)
+        return len(data)
+
+    def close(self):
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._write_next()
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def fast_copy(src, dst):
+    """Copy src to dst with metadata, in-kernel where the OS supports it
+
+    On Linux copy_file_range never moves the data through user space and
+    becomes a reflink on btrfs/XFS. macOS and Windows already get fcopyfile
+    and CopyFile2 through shutil.copy2, which is also the fallback here.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report 0 instead of an error. The
+                        # size says bytes remain, so this is not EOF
+                        raise OSError("copy_file_range copied nothing")
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            # Old kernel (ENOSYS), unsupported filesystem pair (EXDEV) or a
+            # stalled copy, copy2 below rewrites dst from the start
+            pass
+    shutil.copy2(src, dst)
+    return dst
+
+@functools.lru_cache(maxsize=None)
+def source_exists(path):
+    """Cached existence check for checked-in sources the build never modifies"""
+    return os.path.exists(path)
+
+def is_up_to_date(src, dst):
+    """True if dst is src itself or a copy with the same size and mtime"""
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        return True
+    # Copies keep the source mtime (copystat), so a match means unchanged
+    return (src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns)
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst so no bytes are copied, falling back to a real copy"""
+    # Left over from a previous run and unchanged since
+    if is_up_to_date(src, dst):
+        return dst
+    # Never write through an old hardlink, that would modify the source too
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device link, or a filesystem without hardlink support
+        fast_copy(src, dst)
+    return dst
 
 def cleanup_intermediate_files():
     """Clean up intermediate files created during packaging"""
@@ -56,26 +226,38 @@ def cleanup_intermediate_files():
         ".*.swo"
     ]
     
+    # List the working directory once and match every pattern against it,
+    # instead of a stat() or glob listing per pattern
+    present = {entry.name: entry for entry in os.scandir(".")}
+    
     # Clean up files and directories
     for pattern in cleanup_patterns:
         if "/" in pattern:
             # Directory cleanup
             dir_path = pattern.rstrip("/")
-            if os.path.exists(dir_path):
+            if "/" in dir_path:
+                # Nested paths aren't in the listing
+                exists = os.path.exists(dir_path)
+            else:
+                exists = present.pop(dir_path, None) is not None
+            if exists:
                 try:
                     shutil.rmtree(dir_path)
                     print(f"  🗑️  Removed directory: {dir_path}")
                 except Exception as e:
                     print(f"  ⚠️  Could not remove {dir_path}: {e}")
         else:
-            # File pattern cleanup
-            import glob
-            for file_path in glob.glob(pattern):
+            # File pattern cleanup, skipping dotfiles unless the pattern
+            # names them explicitly, as glob does
+            for file_path in fnmatch.filter(list(present), pattern):
+                if file_path.startswith(".") and not pattern.startswith("."):
+                    continue
+                entry = present.pop(file_path)
                 try:
-                    if os.path.isfile(file_path):
+                    if entry.is_file():
                         os.remove(file_path)
                         print(f"  🗑️  Removed file: {file_path}")
-                    elif os.path.isdir(file_path):
+                    elif entry.is_dir():
                         shutil.rmtree(file_path)
                         print(f"  🗑️  Removed directory: {file_path}")
                 except Exception as e:
@@ -83,12 +265,17 @@ def cleanup_intermediate_files():
     
     print("✅ Cleanup complete!")
 
-def package_linux_appimage():
-    """Package for Linux as AppImage"""
+def package_linux_appimage(arch_names=None, jobs=None, compresslevel=ARCHIVE_COMPRESSLEVEL):
+    """Package for Linux as AppImage, for all architectures or just arch_names
+
+    jobs caps how many independent steps (appimagetool runs, launcher files,
+    archive compression) run at once, defaulting to the CPU count.
+    """
+    jobs = jobs or os.cpu_count() or 1
     print("=== Packaging Linux AppImage ===")
     
     # Ensure output directory exists
-    appimage_dir = pathlib.Path("builds/linux/appimage")
+    appimage_dir = APPIMAGE_DIR
     appimage_dir.mkdir(parents=True, exist_ok=True)
     
     # Clean up old AppImages to avoid confusion
@@ -112,43 +299,67 @@ def package_linux_appimage():
         ("aarch64", "dist/JumperlessWokwiBridge_aarch64", "JumperlessWokwiBridge_aarch64.AppDir", "Jumperless-aarch64.AppImage", "JumperlessWokwiBridge")
     ]
     
+    if arch_names:
+        unknown = set(arch_names) - {arch[0] for arch in architectures}
+        if unknown:
+            print(f"❌ Unknown architecture(s): {', '.join(sorted(unknown))}")
+            return False
+        architectures = [arch for arch in architectures if arch[0] in arch_names]
+    
     success_count = 0
     arm64_success = False
+    built_architectures = []
     
-    for arch_name, dist_path, appdir_path, appimage_path, executable_name in architectures:
-        print(f"\n📦 Creating {arch_name} AppImage...")
+    # Each AppImage and the launcher scripts are independent of each other,
+    # and the workers mostly wait on appimagetool or the disk, so threads suffice
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Fetch appimagetool and write the launcher files in the background
+        # while PyInstaller keeps the CPU busy
+        appimagetool_future = executor.submit(download_appimagetool)
+        launchers_future = executor.submit(create_appimage_launchers, appimage_dir, jobs)
         
-        # Create PyInstaller executable for this architecture
-        pyinstaller_cmd = [
-            sys.executable, "-m", "PyInstaller", 
-            "--clean",  # Clear cache for each build
-            "--onefile", 
-            "--console", 
-            "--name", executable_name,
-            "--distpath", dist_path,
-            "--specpath", f"build/spec_{arch_name}",  # Unique spec path per architecture
-            "JumperlessWokwiBridge.py"
-        ]
+        for index, (arch_name, dist_path, appdir_path, appimage_path, executable_name) in enumerate(architectures):
+            print(f"\n📦 Building {arch_name} executable...")
+            
+            # Create PyInstaller executable for this architecture. Only the first
+            # build clears the cache, later ones reuse its analysis of the script
+            pyinstaller_cmd = [
+                sys.executable, "-m", "PyInstaller", 
+                *(["--clean"] if index == 0 else []),
+                "--onefile", 
+                "--console", 
+                "--name", executable_name,
+                "--distpath", dist_path,
+                "--specpath", f"build/spec_{arch_name}",  # Unique spec path per architecture
+                "JumperlessWokwiBridge.py"
+            ]
+            
+            print(f"Running PyInstaller for {arch_name}...")
+            result = subprocess.run(pyinstaller_cmd)
+            
+            if result.returncode != 0:
+                print(f"❌ PyInstaller failed for {arch_name}")
+                continue
+            
+            built_architectures.append((arch_name, dist_path, appdir_path, appimage_path, executable_name))
         
-        print(f"Running PyInstaller for {arch_name}...")
-        result = subprocess.run(pyinstaller_cmd)
+        # Resolved once here before the workers share it
+        appimagetool_future.result()
         
-        if result.returncode != 0:
-            print(f"❌ PyInstaller failed for {arch_name}")
-            continue
+        # Create AppImages
+        appimage_futures = [(arch[0], executor.submit(create_appimage_for_arch, *arch))
+                            for arch in built_architectures]
+        for arch_name, future in appimage_futures:
+            if future.result():
+                success_count += 1
+                if arch_name == "aarch64":
+                    arm64_success = True
         
-        # Create AppImage
-        if create_appimage_for_arch(arch_name, dist_path, appdir_path, appimage_path, executable_name):
-            success_count += 1
-            if arch_name == "aarch64":
-                arm64_success = True
-    
-    # Create launcher scripts for AppImage directory
-    create_appimage_launchers(appimage_dir)
+        launchers_future.result()
     
     # Copy installation script to AppImage directory
     try:
-        install_script_source = pathlib.Path("builds/linux/appimage/install_jumperless.sh")
+        install_script_source = APPIMAGE_DIR / "install_jumperless.sh"
         if install_script_source.exists():
             print("✅ Installation script ready")
         else:
@@ -159,13 +370,25 @@ def package_linux_appimage():
     print(f"\n🎉 Linux AppImage packaging complete! Created {success_count} architecture packages.")
     
     # Create tar.gz archive
-    create_distribution_archive(appimage_dir)
+    create_distribution_archive(appimage_dir, jobs, compresslevel)
     
     # Clean up intermediate files
     cleanup_intermediate_files()
     
     return success_count > 0
 
+# Desktop entry embedded in each AppImage
+APPDIR_DESKTOP_ENTRY = b'''[Desktop Entry]
+Type=Application
+Name=Jumperless Wokwi Bridge
+Exec=AppRun
+Icon=icon
+Comment=Jumperless Wokwi Bridge - Electronics Prototyping Tool
+Categories=Development;Electronics;Education;
+Terminal=true
+StartupNotify=false
+'''
+
 def create_appimage_for_arch(arch_name, dist_path, appdir_path, appimage_path, executable_name):
     """Create AppImage for specific architecture"""
     try:
@@ -183,29 +406,17 @@ def create_appimage_for_arch(arch_name, dist_path, appdir_path, appimage_path, e
             print(f"❌ Executable not found: {executable_source}")
             return False
         
-        shutil.copy2(executable_source, executable_dest)
+        link_or_copy(executable_source, executable_dest)
         os.chmod(executable_dest, 0o755)
         
         # Create desktop file
-        desktop_content = '''[Desktop Entry]
-Type=Application
-Name=Jumperless Wokwi Bridge
-Exec=AppRun
-Icon=icon
-Comment=Jumperless Wokwi Bridge - Electronics Prototyping Tool
-Categories=Development;Electronics;Education;
-Terminal=true
-StartupNotify=false
-'''
-        
         desktop_file = appdir / "Jumperless.desktop"
-        with open(desktop_file, 'w') as f:
-            f.write(desktop_content)
+        desktop_file.write_bytes(APPDIR_DESKTOP_ENTRY)
         
         # Copy icon if available
-        icon_source = pathlib.Path("assets/icons/icon.png")
-        if icon_source.exists():
-            shutil.copy2(icon_source, appdir / "icon.png")
+        icon_source = "assets/icons/icon.png"
+        if source_exists(icon_source):
+            link_or_copy(icon_source, appdir / "icon.png")
         
         # Download appimagetool if needed
         appimagetool_path = download_appimagetool()
@@ -214,11 +425,12 @@ StartupNotify=false
             return False
         
         # Create AppImage
-        appimage_output = pathlib.Path(f"builds/linux/appimage/{appimage_path}")
+        appimage_output = APPIMAGE_DIR / appimage_path
         appimage_cmd = [str(appimagetool_path), str(appdir), str(appimage_output)]
         
         print(f"Creating AppImage: {appimage_output}")
-        result = subprocess.run(appimage_cmd, capture_output=True, text=True)
+        # Only stderr is shown (on failure), so stdout is discarded
+        result = subprocess.run(appimage_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode == 0 and appimage_output.exists():
             # Make executable
@@ -242,8 +454,9 @@ StartupNotify=false
         print(f"❌ Error creating AppImage for {arch_name}: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def download_appimagetool():
-    """Download appimagetool if not already available"""
+    """Download appimagetool if not already available, once per run"""
     tools_dir = pathlib.Path("tools")
     tools_dir.mkdir(exist_ok=True)
     
@@ -276,11 +489,8 @@ def download_appimagetool():
         print(f"❌ Failed to download appimagetool: {e}")
         return None
 
-def create_appimage_launchers(appimage_dir):
-    """Create launcher scripts for AppImage directory"""
-    
-    # Smart launcher script
-    smart_launcher = '''#!/bin/bash
+# Smart launcher script, picks the AppImage for this architecture
+RUN_JUMPERLESS_SH = '''#!/bin/bash
 
 # Simple Jumperless AppImage Launcher
 # Detects architecture and runs the correct AppImage
@@ -327,11 +537,9 @@ fi
 echo "Running: $APPIMAGE_PATH"
 exec "$APPIMAGE_PATH" "$@"
 '''
-    
 
-    
-    # Desktop launcher script
-    desktop_launcher = '''#!/bin/bash
+# Desktop launcher script
+DESKTOP_LAUNCHER_SH = '''#!/bin/bash
 
 # Desktop Launcher for Jumperless
 # This script finds its own location and runs Jumperless from there
@@ -355,24 +563,9 @@ echo "Jumperless has exited."
 echo "Press Enter to close this window..."
 read
 '''
-    
-    # Write launcher scripts
-    smart_launcher_path = appimage_dir / "run_jumperless.sh"
-    with open(smart_launcher_path, 'w', encoding='utf-8') as f:
-        f.write(smart_launcher)
-    os.chmod(smart_launcher_path, 0o755)
-    print(f"✅ Created run_jumperless.sh")
-    
 
-    
-    desktop_launcher_path = appimage_dir / "desktop_launcher.sh"
-    with open(desktop_launcher_path, 'w', encoding='utf-8') as f:
-        f.write(desktop_launcher)
-    os.chmod(desktop_launcher_path, 0o755)
-    print(f"✅ Created desktop_launcher.sh")
-    
-    # Create desktop file
-    desktop_content = '''[Desktop Entry]
+# Desktop entry for the installed app
+DESKTOP_ENTRY = '''[Desktop Entry]
 Version=1.0
 Type=Application
 Name=Jumperless
@@ -384,14 +577,9 @@ Terminal=true
 StartupNotify=true
 Path=/usr/share/applications/
 '''
-    
-    desktop_file_path = appimage_dir / "Jumperless.desktop"
-    with open(desktop_file_path, 'w', encoding='utf-8') as f:
-        f.write(desktop_content)
-    print(f"✅ Created Jumperless.desktop")
-    
-    # Create uninstaller script
-    uninstaller_content = '''#!/bin/bash
+
+# Uninstaller script
+UNINSTALLER_SH = '''#!/bin/bash
 
 # Jumperless Linux Uninstaller Script
 # Completely removes Jumperless from standard Linux directories
@@ -476,21 +664,9 @@ echo "   ./install_jumperless.sh"
 echo ""
 echo "Thanks for using Jumperless! 👋"
 '''
-    
-    uninstaller_path = appimage_dir / "uninstall_jumperless.sh"
-    with open(uninstaller_path, 'w', encoding='utf-8') as f:
-        f.write(uninstaller_content)
-    os.chmod(uninstaller_path, 0o755)
-    print(f"✅ Created uninstall_jumperless.sh")
-    
-    # Copy icon if available
-    icon_source = pathlib.Path("assets/icons/icon.png")
-    if icon_source.exists():
-        shutil.copy2(icon_source, appimage_dir / "icon.png")
-        print(f"✅ Copied icon.png")
-    
-    # Create unified README.md
-    readme_content = '''# Jumperless Linux Distribution
+
+# Unified README.md for the distribution
+DISTRIBUTION_README = '''# Jumperless Linux Distribution
 
 Jumperless App distribution for Linux.
 
@@ -666,11 +842,45 @@ rm ~/.local/share/icons/hicolor/256x256/apps/jumperless.png
 
 Choose the method that best fits your workflow.
 '''
+
+# Files generated into the AppImage directory: name -> (content, mode).
+# Encoded once at import; the templates contain emoji so they can't be
+# bytes literals.
+LAUNCHER_FILES = {
+    "run_jumperless.sh": (RUN_JUMPERLESS_SH.encode('utf-8'), 0o755),
+    "desktop_launcher.sh": (DESKTOP_LAUNCHER_SH.encode('utf-8'), 0o755),
+    "Jumperless.desktop": (DESKTOP_ENTRY.encode('utf-8'), None),
+    "uninstall_jumperless.sh": (UNINSTALLER_SH.encode('utf-8'), 0o755),
+    "README.md": (DISTRIBUTION_README.encode('utf-8'), None),
+}
+
+def write_launcher_file(file_path, content, mode):
+    """Write one generated file as a single whole-file byte write"""
+    file_path.write_bytes(content)
+    if mode is not None:
+        os.chmod(file_path, mode)
+
+def create_appimage_launchers(appimage_dir, jobs=None):
+    """Create launcher scripts for AppImage directory, writing on up to jobs threads"""
     
-    readme_path = appimage_dir / "README.md"
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    print(f"✅ Created unified README.md")
+    # Launcher scripts, desktop file, README and icon are independent files,
+    # so their writes overlap on a few threads
+    icon_source = "assets/icons/icon.png"
+    workers = min(jobs or os.cpu_count() or 1, len(LAUNCHER_FILES) + 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        file_futures = [(file_name, executor.submit(write_launcher_file, appimage_dir / file_name, content, mode))
+                        for file_name, (content, mode) in LAUNCHER_FILES.items()]
+        icon_future = None
+        if source_exists(icon_source):
+            icon_future = executor.submit(link_or_copy, icon_source, appimage_dir / "icon.png")
+        
+        # Reported in a fixed order, re-raising the first failure
+        for file_name, future in file_futures:
+            future.result()
+            print(f"✅ Created {file_name}")
+        if icon_future is not None:
+            icon_future.result()
+            print(f"✅ Copied icon.png")
     
     # Create organized folder structure
     create_organized_structure(appimage_dir)
@@ -683,15 +893,15 @@ def create_organized_structure(appimage_dir):
     python_dir.mkdir(exist_ok=True)
     
     # Copy main application file
-    main_app_source = pathlib.Path("JumperlessWokwiBridge.py")
-    if main_app_source.exists():
-        shutil.copy2(main_app_source, python_dir / "JumperlessWokwiBridge.py")
+    main_app_source = "JumperlessWokwiBridge.py"
+    if source_exists(main_app_source):
+        link_or_copy(main_app_source, python_dir / "JumperlessWokwiBridge.py")
         print(f"✅ Copied JumperlessWokwiBridge.py to python/")
     
     # Copy requirements file
-    requirements_source = pathlib.Path("requirements.txt")
-    if requirements_source.exists():
-        shutil.copy2(requirements_source, python_dir / "requirements.txt")
+    requirements_source = "requirements.txt"
+    if source_exists(requirements_source):
+        link_or_copy(requirements_source, python_dir / "requirements.txt")
         print(f"✅ Copied requirements.txt to python/")
     
     # Remove any old README files since we now use a single README.md
@@ -701,63 +911,237 @@ def create_organized_structure(appimage_dir):
         "README_STANDARD_INSTALLATION.md"
     ]
     
+    existing = {entry.name for entry in os.scandir(appimage_dir)}
     for readme_file in old_readme_files:
-        readme_path = appimage_dir / readme_file
-        if readme_path.exists():
-            readme_path.unlink()
+        if readme_file in existing:
+            (appimage_dir / readme_file).unlink()
             print(f"✅ Removed old {readme_file}")
     
     print(f"✅ Created organized structure with python/ folder")
 
-def create_distribution_archive(appimage_dir):
-    """Create tar.gz archive of the AppImage directory"""
+def iter_archive_entries(root, prefix):
+    """Yield (DirEntry, archive name) for everything under root, in name order
+
+    Uses os.scandir so file types come from the directory listing itself, and
+    skips .fuse_hidden* leftovers from files that were still open.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.name.startswith('.fuse_hidden'):
+            continue
+        name = f"{prefix}/{entry.name}"
+        yield entry, name
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_archive_entries(entry.path, name)
+
+def write_tar_stream(fileobj, source_dir, arcname):
+    """Write source_dir to fileobj as an uncompressed tar stream"""
+    import tarfile
+    
+    with tarfile.open(fileobj=fileobj, mode="w|",
+                      bufsize=ARCHIVE_BUFSIZE, copybufsize=ARCHIVE_BUFSIZE) as tar:
+        root_info = tar.gettarinfo(source_dir, arcname)
+        root_info.uid = root_info.gid = 0
+        root_info.uname = root_info.gname = ""
+        tar.addfile(root_info)
+        for entry, name in iter_archive_entries(source_dir, arcname):
+            st = entry.stat(follow_symlinks=False)
+            if stat.S_ISDIR(st.st_mode) or (stat.S_ISREG(st.st_mode) and st.st_nlink == 1):
+                # Built from the stat directly, gettarinfo would also look up
+                # the owner and group names of every entry
+                tarinfo = tarfile.TarInfo(name)
+                tarinfo.type = tarfile.DIRTYPE if stat.S_ISDIR(st.st_mode) else tarfile.REGTYPE
+                tarinfo.mode = stat.S_IMODE(st.st_mode)
+                tarinfo.mtime = st.st_mtime
+                tarinfo.size = st.st_size if tarinfo.isreg() else 0
+            else:
+                # Symlinks and hardlinked files keep tarfile's own handling
+                tarinfo = tar.gettarinfo(entry.path, name)
+            # Extracting users own the files anyway, like GNU tar's --owner=0
+            tarinfo.uid = tarinfo.gid = 0
+            tarinfo.uname = tarinfo.gname = ""
+            if tarinfo.isreg():
+                with open(entry.path, 'rb') as f:
+                    tar.addfile(tarinfo, f)
+            else:
+                tar.addfile(tarinfo)
+
+@functools.lru_cache(maxsize=None)
+def find_tool(name):
+    """Return the path of an optional external tool, or None, without spawning it"""
+    return shutil.which(name)
+
+@functools.lru_cache(maxsize=1)
+def find_gnu_tar():
+    """Return the path of GNU tar 1.28+, or None (bsdtar has no --transform, older GNU tar no --sort)"""
+    tar_path = find_tool("tar")
+    if not tar_path:
+        return None
+    try:
+        result = subprocess.run([tar_path, "--version"], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"GNU tar\)? (\d+)\.(\d+)", result.stdout)
+    if not match or (int(match.group(1)), int(match.group(2))) < (1, 28):
+        return None
+    return tar_path
+
+def write_tar(fileobj, source_dir, arcname):
+    """Write source_dir to fileobj as a tar stream, using GNU tar when available
+
+    GNU tar walks and reads the tree natively, tarfile is the portable fallback.
+    """
+    tar_path = find_gnu_tar()
+    if not tar_path:
+        write_tar_stream(fileobj, source_dir, arcname)
+        return
+    
+    tar_cmd = [tar_path, "-c", "-f", "-", "-C", str(source_dir),
+               "--exclude=.fuse_hidden*", "--sort=name",
+               "--owner=0", "--group=0", "--numeric-owner",
+               f"--transform=s,^\\.,{arcname},S", "."]
+    try:
+        fileno = fileobj.fileno()
+    except (AttributeError, OSError):
+        fileno = None
+    
+    if fileno is not None:
+        # Real pipe or file, let tar write straight into it
+        fileobj.flush()
+        subprocess.run(tar_cmd, stdout=fileno, check=True)
+    else:
+        # Unbuffered pipe read into one reused buffer, so relaying tens of MB
+        # allocates no per-chunk bytes objects
+        tar = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, bufsize=0)
+        buffer = bytearray(ARCHIVE_BUFSIZE)
+        view = memoryview(buffer)
+        try:
+            while n := tar.stdout.readinto(buffer):
+                fileobj.write(view[:n])
+        finally:
+            # Reap tar even when the writer failed, closing the pipe first
+            # lets it exit instead of blocking on a full pipe
+            tar.stdout.close()
+            tar.wait()
+        if tar.returncode != 0:
+            raise subprocess.CalledProcessError(tar.returncode, tar_cmd)
+
+def estimate_archive_size(root):
+    """Rough archive size: the files directly in root, which hold the AppImages
+
+    One directory listing rather than a second walk of the whole tree, the
+    small files in subdirectories are rounding error next to the AppImages.
+    """
+    with os.scandir(root) as it:
+        return sum(entry.stat(follow_symlinks=False).st_size
+                   for entry in it if entry.is_file(follow_symlinks=False))
+
+def preallocate(fd, size):
+    """Reserve size bytes for fd up front where the platform supports it"""
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        # Filesystem without fallocate support, the file just grows as written
+        pass
+
+def create_distribution_archive(appimage_dir, jobs=None, compresslevel=ARCHIVE_COMPRESSLEVEL):
+    """Create tar.gz archive of the AppImage directory, compressing on up to jobs threads"""
+    jobs = jobs or os.cpu_count() or 1
     
     print("\n📦 Creating distribution archive...")
     
     # Create archive path
-    linux_dir = pathlib.Path("builds/linux")
-    archive_path = linux_dir / "Jumperless-Linux.tar.gz"
+    archive_path = DISTRIBUTION_ARCHIVE
     
     # Remove any existing archive
     if archive_path.exists():
         archive_path.unlink()
     
     try:
-        import tarfile
-        import tempfile
-        
-        # Create a temporary clean directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = pathlib.Path(temp_dir)
-            clean_appimage_dir = temp_path / "jumperless"
-            
-            # Copy everything except fuse_hidden files
-            shutil.copytree(appimage_dir, clean_appimage_dir, 
-                          ignore=lambda dir, files: [f for f in files if f.startswith('.fuse_hidden')])
-            
-            # Create tar.gz archive
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(clean_appimage_dir, arcname="jumperless")
+        # Create tar.gz archive straight from the AppImage directory, streaming
+        # through large buffers and compressing on all cores
+        with open(archive_path, 'wb', buffering=ARCHIVE_WRITE_BUFSIZE) as archive_file:
+            # Reserve about the final size so the archive lands in contiguous
+            # extents, its bulk is AppImages that barely compress
+            preallocate(archive_file.fileno(), estimate_archive_size(appimage_dir))
             
-            # Get archive size
-            archive_size = archive_path.stat().st_size / 1024  # KB
-            print(f"✅ Created distribution archive: {archive_path} ({archive_size:.0f}KB)")
+            pigz_path = find_tool("pigz")
+            if pigz_path:
+                # pigz is a multi-threaded gzip, output stays a plain .tar.gz
+                pigz = subprocess.Popen([pigz_path, f"-{compresslevel}", "-p", str(jobs), "-c"],
+                                        stdin=subprocess.PIPE, stdout=archive_file)
+                try:
+                    write_tar(pigz.stdin, appimage_dir, "jumperless")
+                finally:
+                    # Reap pigz even when tar failed, closing stdin lets it exit
+                    pigz.stdin.close()
+                    pigz.wait()
+                if pigz.returncode != 0:
+                    raise RuntimeError(f"pigz exited with code {pigz.returncode}")
+            else:
+                with ParallelGzipWriter(archive_file, compresslevel, workers=jobs) as gz_file:
+                    write_tar(gz_file, appimage_dir, "jumperless")
             
+            # Give back the unused part of the reservation. pigz writes through
+            # the shared descriptor, so its offset marks the real end
+            archive_file.flush()
+            fd = archive_file.fileno()
+            os.ftruncate(fd, os.lseek(fd, 0, os.SEEK_CUR))
+        
+        # Get archive size
+        archive_size = archive_path.stat().st_size / 1024  # KB
+        print(f"✅ Created distribution archive: {archive_path} ({archive_size:.0f}KB)")
+    
     except Exception as e:
         print(f"❌ Failed to create archive: {e}")
+        # A preallocated, partly written file would look like a finished archive
+        try:
+            archive_path.unlink()
+        except FileNotFoundError:
+            pass
 
-def main():
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Jumperless Universal Multi-Platform Packager")
+    parser.add_argument("--arch", default="x86_64,aarch64",
+                        help="comma-separated architectures to build in this run (default: x86_64,aarch64)")
+    parser.add_argument("--jobs", type=positive_int, default=os.cpu_count() or 1,
+                        help="maximum number of packaging steps to run in parallel (default: CPU count)")
+    parser.add_argument("--compresslevel", type=int, choices=range(1, 10), default=ARCHIVE_COMPRESSLEVEL,
+                        metavar="1-9",
+                        help=f"gzip level for the distribution archive (default: {ARCHIVE_COMPRESSLEVEL}, fastest)")
+    args = parser.parse_args(argv)
+    args.arch = [arch.strip() for arch in args.arch.split(",") if arch.strip()]
+    return args
+
+def main(argv=None):
     """Main function"""
+    args = parse_args(argv)
+    
     print("🚀 Jumperless Universal Multi-Platform Packager")
     print("=" * 50)
     
-    if not os.path.exists("JumperlessWokwiBridge.py"):
+    if not source_exists("JumperlessWokwiBridge.py"):
         print("❌ JumperlessWokwiBridge.py not found!")
         print("Make sure you're running this script from the project root directory.")
         return 1
     
     # Default to Linux AppImage packaging
-    success = package_linux_appimage()
+    success = package_linux_appimage(args.arch, args.jobs, args.compresslevel)
     
     if success:
         print("\n🎉 Packaging completed successfully!")
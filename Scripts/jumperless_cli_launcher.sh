@@ -26,11 +26,11 @@ main() {
         "macOS")
             # macOS launch with terminal resizing
             if [ -f "/Applications/Jumperless.app/Contents/MacOS/Jumperless_cli" ]; then
-                osascript -e 'tell application "Terminal"
+                # One do script opens the window with the command already
+                # running, no empty window plus a fixed delay
+                exec osascript -e 'tell application "Terminal"
                     activate
-                    set newWindow to do script ""
-                    delay 0.5
-                    do script "cd /Applications/Jumperless.app/Contents/MacOS && ./Jumperless_cli" in newWindow
+                    do script "cd /Applications/Jumperless.app/Contents/MacOS && ./Jumperless_cli"
                     set bounds of front window to {100, 100, 1000, 700}
                 end tell'
             else
@@ -65,6 +65,7 @@ set "terminal_list="
 :: Check for Windows Terminal
 where wt >nul 2>&1
 if !errorlevel! equ 0 (
+    set "have_wt=1"
     set /a terminals_found+=1
     set "terminal_list=!terminal_list!!terminals_found!. Windows Terminal (wt)^
 
@@ -76,6 +77,7 @@ if !errorlevel! equ 0 (
 :: Check for PowerShell 7+
 where pwsh >nul 2>&1
 if !errorlevel! equ 0 (
+    set "have_pwsh=1"
     set /a terminals_found+=1
     set "terminal_list=!terminal_list!!terminals_found!. PowerShell 7+ (pwsh)^
 
@@ -133,16 +135,14 @@ set /p "choice=Choose terminal (1-!terminals_found!) or press ENTER for auto-det
 if "!choice!"=="" (
     :: Auto-detect best terminal
     echo Auto-detecting best terminal...
-    where wt >nul 2>&1
-    if !errorlevel! equ 0 (
+    if defined have_wt (
         echo Using Windows Terminal (auto-detected)
         set "chosen_cmd=wt"
         set "chosen_name=Windows Terminal"
         goto :run_app
     )
     
-    where pwsh >nul 2>&1
-    if !errorlevel! equ 0 (
+    if defined have_pwsh (
         echo Using PowerShell 7+ (auto-detected)
         set "chosen_cmd=pwsh"
         set "chosen_name=PowerShell 7+"